@@ -1,9 +1,8 @@
 import argparse
 import random
 import threading
-import time
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, Literal
+from typing import Literal
 
 from py_tic_tac_toe.factories import (
     config_game_engine,
@@ -12,13 +11,11 @@ from py_tic_tac_toe.factories import (
     create_network_host_players,
 )
 from py_tic_tac_toe.game_engine import GameEngine
+from py_tic_tac_toe.ui import Ui
 from py_tic_tac_toe.ui_pygame import PygameUi
 from py_tic_tac_toe.ui_terminal import TerminalUi
 from py_tic_tac_toe.ui_tk import TkUi
 
-if TYPE_CHECKING:
-    from py_tic_tac_toe.ui import Ui
-
 
 def main() -> None:
     ui_choices: dict[str, type[Ui]] = {"terminal": TerminalUi, "pygame": PygameUi, "tk": TkUi}
@@ -67,22 +64,31 @@ def main() -> None:
     # Set players and connect UI callbacks.
     config_game_engine(game_engine, (player1, player2), uis)
 
-    # Create and start UI threads.
-    ui_threads = [threading.Thread(target=ui.run, daemon=True) for ui in uis]
+    # Run one UI on the main thread (Tk requires it) and the rest in background threads.
+    main_ui = next((ui for ui in uis if isinstance(ui, TkUi)), uis[-1])
+    ui_threads = [threading.Thread(target=ui.run, daemon=True) for ui in uis if ui is not main_ui]
     for ui_thread in ui_threads:
         ui_thread.start()
 
-    # Wait for all UIs to be running before starting the game loop.
-    while not all(ui.running for ui in uis):
-        time.sleep(0.1)
+    # The main UI only starts running below, so the game loop is started from a helper thread once all UIs are ready.
+    threading.Thread(target=_start_game_loop_when_ready, args=(game_engine, uis), daemon=True).start()
 
-    # Start the game loop.
-    game_engine.start_game_loop()
+    # Blocks until the main UI is closed.
+    main_ui.run()
 
-    # Wait for all UI threads to finish.
+    # Wait for the remaining UI threads to finish.
     for ui_thread in ui_threads:
         ui_thread.join()
 
+    # Stop the game loop thread, it may still be waiting for a move if the UIs were closed mid-game.
+    game_engine.stop_game_loop()
+
+
+def _start_game_loop_when_ready(game_engine: GameEngine, uis: Iterable[Ui]) -> None:
+    for ui in uis:
+        ui.wait_until_running()
+    game_engine.start_game_loop()
+
 
 def _parse_args(ui_type_choices: Iterable[str]) -> tuple[argparse.ArgumentParser, argparse.Namespace]:
     parser = argparse.ArgumentParser()
@@ -6,6 +6,35 @@ from py_tic_tac_toe.exception import InvalidMoveError
 BOARD_SIZE: Final = 3
 type PlayerSymbol = Literal["X", "O"]
 
+# The board is stored as one bitmask per player: bit (row * BOARD_SIZE + col) is set when that player owns the cell.
+CELL_COUNT: Final = BOARD_SIZE * BOARD_SIZE
+FULL_MASK: Final = (1 << CELL_COUNT) - 1
+
+
+# (row, col) of every cell, indexed by bit position. Shared so that position lists don't build new tuples.
+_COORDS: Final = tuple(divmod(i, BOARD_SIZE) for i in range(CELL_COUNT))
+
+
+def cell_mask(row: int, col: int) -> int:
+    return 1 << (row * BOARD_SIZE + col)
+
+
+WIN_MASKS: Final = (
+    *(sum(cell_mask(r, c) for c in range(BOARD_SIZE)) for r in range(BOARD_SIZE)),  # Horizontal lines
+    *(sum(cell_mask(r, c) for r in range(BOARD_SIZE)) for c in range(BOARD_SIZE)),  # Vertical lines
+    sum(cell_mask(i, i) for i in range(BOARD_SIZE)),  # First diagonal
+    sum(cell_mask(i, BOARD_SIZE - 1 - i) for i in range(BOARD_SIZE)),  # Second diagonal
+)
+
+
+# Whether each possible player bitmask contains a complete winning line, so a check is a single lookup.
+_HAS_LINE: Final = tuple(any(mask & line == line for line in WIN_MASKS) for mask in range(FULL_MASK + 1))
+
+
+def has_line(mask: int) -> bool:
+    """Check whether a player's bitmask contains a complete winning line."""
+    return _HAS_LINE[mask]
+
 
 @dataclass(frozen=True, slots=True)
 class Move:
@@ -15,56 +44,74 @@ class Move:
 
 
 class Board:
+    __slots__ = ("_o", "_occupied", "_winner", "_x")
+
     def __init__(self) -> None:
-        self._board: list[list[PlayerSymbol | None]] = [[None] * BOARD_SIZE for _ in range(BOARD_SIZE)]
+        self._x = 0
+        self._o = 0
+        self._occupied = 0  # Union of both masks, kept up to date by apply_move().
+        self._winner: PlayerSymbol | None = None  # Only the player who just moved can complete a line.
+
+    @property
+    def board(self) -> tuple[tuple[PlayerSymbol | None, ...], ...]:
+        """Immutable snapshot of the board as a tuple of rows, for display purposes."""
+        cells = self.cells
+        return tuple(cells[start : start + BOARD_SIZE] for start in range(0, CELL_COUNT, BOARD_SIZE))
 
     @property
-    def board(self) -> list[list[PlayerSymbol | None]]:
-        return self._board
+    def cells(self) -> tuple[PlayerSymbol | None, ...]:
+        """Snapshot of the board as a flat tuple, indexed by row * BOARD_SIZE + col."""
+        x, o = self._x, self._o
+        return tuple("X" if (x >> i) & 1 else "O" if (o >> i) & 1 else None for i in range(CELL_COUNT))
+
+    def get_mask(self, player: PlayerSymbol) -> int:
+        return self._x if player == "X" else self._o
 
     def clone(self) -> "Board":
-        copied = Board()
-        copied._board = [row[:] for row in self._board]
+        # Skip __init__: every field is overwritten below.
+        copied: Board = Board.__new__(Board)
+        copied._x = self._x
+        copied._o = self._o
+        copied._occupied = self._occupied
+        copied._winner = self._winner
         return copied
 
     def validate_move(self, move: Move) -> None:
         """Validate a move without applying it. Raises IndexError or InvalidMoveError if invalid."""
-        if not (0 <= move.row < len(self._board)) or not (0 <= move.col < len(self._board[0])):
+        if not (0 <= move.row < BOARD_SIZE) or not (0 <= move.col < BOARD_SIZE):
             raise IndexError("Move out of bounds.")
 
         if self.is_game_over():
             raise InvalidMoveError("Game over.")
 
-        if self._board[move.row][move.col] is not None:
+        if self._occupied & cell_mask(move.row, move.col):
             raise InvalidMoveError("Cell occupied.")
 
     def apply_move(self, move: Move) -> None:
         self.validate_move(move)
-        self._board[move.row][move.col] = move.player
+        mask = cell_mask(move.row, move.col)
+        self._occupied |= mask
+        if move.player == "X":
+            self._x |= mask
+            if _HAS_LINE[self._x]:
+                self._winner = "X"
+        else:
+            self._o |= mask
+            if _HAS_LINE[self._o]:
+                self._winner = "O"
 
     def get_available_positions(self) -> list[tuple[int, int]]:
-        return [
-            (r, c) for r in range(len(self._board)) for c in range(len(self._board[0])) if self._board[r][c] is None
-        ]
+        occupied = self._occupied
+        return [_COORDS[i] for i in range(CELL_COUNT) if not (occupied >> i) & 1]
 
     def is_full(self) -> bool:
-        return all(all(cell is not None for cell in row) for row in self._board)
-
-    def get_winner(self) -> str | None:
-        lines: list[list[PlayerSymbol | None]] = []
-
-        lines.extend(self._board)  # Horizontal lines
-        lines.extend([list(row) for row in zip(*self._board, strict=True)])  # Vertical lines
-        lines.append([self._board[i][i] for i in range(len(self._board))])  # First diagonal
-        lines.append([self._board[i][len(self._board) - 1 - i] for i in range(len(self._board))])  # Second diagonal
+        return self._occupied == FULL_MASK
 
-        for line in lines:
-            if line[0] is not None and all(cell == line[0] for cell in line[1:]):
-                return line[0]
-        return None
+    def get_winner(self) -> PlayerSymbol | None:
+        return self._winner
 
     def is_draw(self) -> bool:
-        return self.is_full() and self.get_winner() is None
+        return self._winner is None and self.is_full()
 
     def is_game_over(self) -> bool:
-        return self.is_full() or self.get_winner() is not None
+        return self._winner is not None or self.is_full()
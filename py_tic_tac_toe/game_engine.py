@@ -10,8 +10,9 @@ from py_tic_tac_toe.player import Player
 class GameEngine:
     def __init__(self) -> None:
         self._game = Game()
-        self._board_updated_cbs: list[Callable[[], None]] = []
-        self._on_error_cbs: list[Callable[[Exception], None]] = []
+        # Callback tuples are replaced rather than mutated, so notifying can iterate them without copying.
+        self._board_updated_cbs: tuple[Callable[[], None], ...] = ()
+        self._on_error_cbs: tuple[Callable[[Exception], None], ...] = ()
         self._running = False
         self._game_thread: threading.Thread | None = None
 
@@ -28,10 +29,10 @@ class GameEngine:
         self._player2 = player2
 
     def add_board_updated_cb(self, callback: Callable[[], None]) -> None:
-        self._board_updated_cbs.append(callback)
+        self._board_updated_cbs = (*self._board_updated_cbs, callback)
 
     def add_on_error_cb(self, callback: Callable[[Exception], None]) -> None:
-        self._on_error_cbs.append(callback)
+        self._on_error_cbs = (*self._on_error_cbs, callback)
 
     def start(self) -> None:
         """Start the game in manual mode. The caller must call tick() to advance the game."""
@@ -47,8 +48,13 @@ class GameEngine:
         self._game_thread.start()
 
     def stop_game_loop(self) -> None:
-        """Stop the automatic game loop."""
+        """Stop the automatic game loop.
+
+        The players are closed so that a loop blocked waiting for a move wakes up and the thread can be joined.
+        """
         self._running = False
+        self._player1.close()
+        self._player2.close()
         if self._game_thread:
             self._game_thread.join(timeout=1.0)
             self._game_thread = None
@@ -95,10 +101,10 @@ class GameEngine:
         self._running = False
 
     def _notify_board_updated(self) -> None:
-        for callback in list(self._board_updated_cbs):
+        for callback in self._board_updated_cbs:
             callback()
 
     def _notify_on_error(self, exception: Exception) -> None:
         """Notify error callbacks when any error occurs."""
-        for callback in list(self._on_error_cbs):
+        for callback in self._on_error_cbs:
             callback(exception)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from queue import Empty, Full, Queue
+from queue import Empty, Full, Queue, ShutDown
 
 from py_tic_tac_toe.board import PlayerSymbol
 from py_tic_tac_toe.exception import LogicError
@@ -22,7 +22,7 @@ class Player(ABC):
         """Get the next pending move if one is available."""
         try:
             return self._move_queue.get(block=block, timeout=timeout)
-        except Empty:
+        except (Empty, ShutDown):
             return None
 
     def queue_move(self, row: int, col: int) -> None:
@@ -31,3 +31,9 @@ class Player(ABC):
             self._move_queue.put_nowait((row, col))
         except Full as e:
             raise LogicError("Pending move queue is full.") from e
+        except ShutDown as e:
+            raise LogicError("Player is closed.") from e
+
+    def close(self) -> None:
+        """Stop accepting moves and wake up any caller blocked in get_pending_move()."""
+        self._move_queue.shutdown(immediate=True)
@@ -1,11 +1,57 @@
+import functools
 import random
 from abc import ABC, abstractmethod
 
-from py_tic_tac_toe.board import Board, PlayerSymbol
+from py_tic_tac_toe.board import BOARD_SIZE, CELL_COUNT, FULL_MASK, Board, PlayerSymbol, has_line
 from py_tic_tac_toe.exception import LogicError
 from py_tic_tac_toe.player import Player
 
 
+def _position_key(x_mask: int, o_mask: int) -> int:
+    return (x_mask << CELL_COUNT) | o_mask
+
+
+@functools.cache
+def _best_moves() -> dict[int, tuple[int, int]]:
+    """Solve the game with a memoized negamax search and return the best move for each non-terminal position.
+
+    Only positions reachable in a legal game are stored, keyed by _position_key().
+    """
+    best_moves: dict[int, tuple[int, int]] = {}
+    values: dict[int, int] = {}
+
+    def negamax(mover: int, other: int) -> int:
+        """Score a position for the player to move: positive wins, negative loses, faster results score higher."""
+        key = (mover << CELL_COUNT) | other
+        value = values.get(key)
+        if value is not None:
+            return value
+
+        free = ~(mover | other) & FULL_MASK
+        if has_line(other):
+            value = -(free.bit_count() + 1)
+        elif not free:
+            value = 0
+        else:
+            value = -CELL_COUNT - 2
+            best_cell = 0
+            for cell in range(CELL_COUNT):
+                bit = 1 << cell
+                if free & bit:
+                    score = -negamax(other, mover | bit)
+                    if score > value:
+                        value, best_cell = score, cell
+            # X moves first, so the player to move is X exactly when both players have placed the same number of marks.
+            x, o = (mover, other) if mover.bit_count() == other.bit_count() else (other, mover)
+            best_moves[_position_key(x, o)] = divmod(best_cell, BOARD_SIZE)
+
+        values[key] = value
+        return value
+
+    negamax(0, 0)
+    return best_moves
+
+
 class AiPlayer(Player, ABC):
     def __init__(self, symbol: PlayerSymbol, board: Board) -> None:
         super().__init__(symbol)
@@ -33,67 +79,9 @@ class RandomAiPlayer(AiPlayer):
 
 
 class HardAiPlayer(AiPlayer):
-    def _find_move(self) -> tuple[int, int] | None:  # noqa: PLR0911
-        """Strategy-based AI using human-like optimal heuristics."""
-        available = self._board.get_available_positions()
-        if not available:
+    def _find_move(self) -> tuple[int, int] | None:
+        """Perfect play, looked up in a table of best moves solved once for every reachable position."""
+        if self._board.is_game_over():
             return None
+        return _best_moves()[_position_key(self._board.get_mask("X"), self._board.get_mask("O"))]
 
-        opponent: PlayerSymbol = "O" if self._symbol == "X" else "X"
-
-        # 1. Win if possible (finish our line)
-        for row, col in available:
-            self._board.board[row][col] = self._symbol
-            if self._board.get_winner() == self._symbol:
-                self._board.board[row][col] = None
-                return (row, col)
-            self._board.board[row][col] = None
-
-        # 2. Block opponent's winning move
-        for row, col in available:
-            self._board.board[row][col] = opponent
-            if self._board.get_winner() == opponent:
-                self._board.board[row][col] = None
-                return (row, col)
-            self._board.board[row][col] = None
-
-        # 3. Create a fork (two winning threats)
-        fork_move = self._find_fork_move(available, self._symbol)
-        if fork_move:
-            return fork_move
-
-        # 4. Block opponent's fork
-        fork_move = self._find_fork_move(available, opponent)
-        if fork_move:
-            return fork_move
-
-        # 5. Take center (strongest position)
-        if (1, 1) in available:
-            return (1, 1)
-
-        # 6. Take corner (next best positions)
-        corners = [(0, 0), (0, 2), (2, 0), (2, 2)]
-        corner_moves = [c for c in corners if c in available]
-        if corner_moves:
-            return random.choice(corner_moves)
-
-        # 7. Take edge (remaining positions)
-        return available[0]
-
-    def _find_fork_move(self, available: list[tuple[int, int]], symbol: PlayerSymbol) -> tuple[int, int] | None:
-        """Find a move that creates two winning threats (fork)."""
-        for row, col in available:
-            self._board.board[row][col] = symbol
-            # Count how many winning moves this creates
-            winning_threats = 0
-            for test_row, test_col in self._board.get_available_positions():
-                self._board.board[test_row][test_col] = symbol
-                if self._board.get_winner() == symbol:
-                    winning_threats += 1
-                self._board.board[test_row][test_col] = None
-            self._board.board[row][col] = None
-
-            if winning_threats >= 2:  # noqa: PLR2004
-                return (row, col)
-
-        return None
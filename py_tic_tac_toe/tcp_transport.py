@@ -10,11 +10,14 @@ from queue import Empty, Queue, ShutDown
 class TcpTransport:
     def __init__(self, sock: socket.socket) -> None:
         self._sock = sock
-        self._handlers: dict[str, list[Callable[[dict[str, object]], None]]] = {}
+        # Copy-on-write: the dict and its tuples are replaced, never mutated, so dispatch reads them without locking.
+        self._handlers: dict[str, tuple[Callable[[dict[str, object]], None], ...]] = {}
         self._msg_queue: Queue[dict[str, object]] = Queue()
-        self._handlers_lock = threading.Lock()  # Prevents race conditions when accessing handlers.
+        self._handlers_lock = threading.Lock()  # Serializes handler updates, so none of them are lost.
         self._close_lock = threading.Lock()  # Prevents closing the transport multiple times concurrently.
         self._running = False
+        # Messages are small and each one is awaited by the peer, send them right away instead of waiting for Nagle.
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         self._sock.settimeout(0.25)  # Set a timeout for recv to allow periodic checks for shutdown.
         self._thread = threading.Thread(target=self._recv_loop, daemon=True)
         self._thread.start()
@@ -29,8 +32,22 @@ class TcpTransport:
             raise
 
     def _send_impl(self, msg: dict[str, object]) -> None:
-        data = json.dumps(msg).encode("utf-8") + b"\n"
-        self._sock.sendall(data)
+        payload = json.dumps(msg).encode("utf-8")
+        self._send_buffers([payload, b"\n"])
+
+    def _send_buffers(self, buffers: list[bytes]) -> None:
+        """Send all the buffers, in order, without concatenating them first (uses writev where available)."""
+        if not hasattr(self._sock, "sendmsg"):  # Not available on Windows.
+            self._sock.sendall(b"".join(buffers))
+            return
+        views = [memoryview(buffer) for buffer in buffers]
+        while views:
+            sent = self._sock.sendmsg(views)
+            # Drop the buffers that were sent completely and trim the one that was sent partially, if any.
+            while views and sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            if sent:
+                views[0] = views[0][sent:]
 
     def recv(self, *, block: bool = True, timeout: float | None = None) -> dict[str, object] | None:
         try:
@@ -40,7 +57,7 @@ class TcpTransport:
 
     def add_recv_handler(self, msg_type: str, handler: Callable[[dict[str, object]], None]) -> None:
         with self._handlers_lock:
-            self._handlers.setdefault(msg_type, []).append(handler)
+            self._handlers = {**self._handlers, msg_type: (*self._handlers.get(msg_type, ()), handler)}
         # Drain the queue to trigger any handlers for messages that arrived before the handler was registered.
         messages = []
         while True:
@@ -62,15 +79,18 @@ class TcpTransport:
 
     def remove_recv_handler(self, msg_type: str, handler: Callable[[dict[str, object]], None]) -> None:
         with self._handlers_lock:
-            handlers = self._handlers.get(msg_type)
-            if not handlers:
-                return
+            handlers = self._handlers.get(msg_type, ())
             try:
-                handlers.remove(handler)
+                index = handlers.index(handler)
             except ValueError:
                 return
-            if not handlers:
-                self._handlers.pop(msg_type, None)
+            remaining = handlers[:index] + handlers[index + 1 :]
+            new_handlers = dict(self._handlers)
+            if remaining:
+                new_handlers[msg_type] = remaining
+            else:
+                del new_handlers[msg_type]
+            self._handlers = new_handlers
 
     def _recv_loop(self) -> None:
         buffer = b""
@@ -100,14 +120,14 @@ class TcpTransport:
         msg_type = msg.get("type")
         if not isinstance(msg_type, str):
             raise TypeError("Invalid type for 'type' field")
-        with self._handlers_lock:
-            handlers = self._handlers.get(msg_type, []).copy()
-        # If there are handlers, call them. Otherwise, put the message in the queue for recv() to handle.
-        if handlers:
-            for handler in handlers:
-                handler(msg)
-        else:
+        try:
+            handlers = self._handlers[msg_type]
+        except KeyError:
+            # No handlers, put the message in the queue for recv() to handle.
             self._msg_queue.put(msg)
+            return
+        for handler in handlers:
+            handler(msg)
 
     def _close(self) -> None:
         if not self._close_lock.acquire(blocking=False):
@@ -122,7 +142,7 @@ class TcpTransport:
             with contextlib.suppress(OSError):
                 self._sock.close()
             with self._handlers_lock:
-                self._handlers.clear()
+                self._handlers = {}
             with contextlib.suppress(RuntimeError, ValueError):
                 self._msg_queue.shutdown(immediate=True)
         finally:
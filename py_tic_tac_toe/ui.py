@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 
 from py_tic_tac_toe.game_engine import GameEngine
@@ -7,14 +8,16 @@ class Ui(ABC):
     def __init__(self, game_engine: GameEngine) -> None:
         self._game_engine = game_engine
         self._running = False
+        self._ready = threading.Event()
         self._input_enabled = False
 
-    @property
-    def running(self) -> bool:
-        return self._running
+    def wait_until_running(self, timeout: float | None = None) -> bool:
+        """Block until run() has finished initializing the UI. Returns False on timeout."""
+        return self._ready.wait(timeout)
 
     def run(self) -> None:
         self._running = True
+        self._ready.set()
 
     def _stop(self) -> None:
         self._running = False
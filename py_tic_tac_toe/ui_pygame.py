@@ -21,7 +21,7 @@ class PygameUi(Ui):
 
     def __init__(self, game_engine: GameEngine) -> None:
         super().__init__(game_engine)
-        self._board = self._game_engine.game.board.board.copy()
+        self._board = self._game_engine.game.board.board
         self._title = self.TITLE
         self._title_changed = False
         self._end_message = ""
@@ -88,7 +88,7 @@ class PygameUi(Ui):
         self._queue_move(row, col)
 
     def _render_board(self) -> None:
-        self._board = self._game_engine.game.board.board.copy()
+        self._board = self._game_engine.game.board.board
 
     def _show_end_message(self, msg: str) -> None:
         self._end_message = msg
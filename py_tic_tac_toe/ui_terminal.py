@@ -60,17 +60,16 @@ class TerminalUi(Ui):
             input()
 
     def _render_board(self) -> None:
-        board = self._game_engine.game.board.board
+        cells = self._game_engine.game.board.cells
 
         def _cell_value(index: int) -> str:
-            row, col = divmod(index, len(board[0]))
-            value = board[row][col]
+            value = cells[index]
             return value if value is not None else str(index + 1)
 
         rows = []
-        for r in range(len(board)):
-            start = r * len(board[0])
-            row = " | ".join(_cell_value(start + i) for i in range(len(board[0])))
+        for r in range(BOARD_SIZE):
+            start = r * BOARD_SIZE
+            row = " | ".join(_cell_value(start + i) for i in range(BOARD_SIZE))
             rows.append(f" {row} ")
 
         separator = "\n-----------\n"
@@ -1,6 +1,8 @@
 import threading
 import tkinter as tk
+from collections.abc import Callable
 from functools import partial
+from queue import Empty, SimpleQueue
 from tkinter import messagebox
 from typing import Final
 
@@ -11,17 +13,24 @@ from py_tic_tac_toe.ui import Ui
 
 class TkUi(Ui):
     TITLE: Final = "Tic-Tac-Toe (Tk)"
+    UI_CALLS_POLL_MS: Final = 20
 
     def __init__(self, game_engine: GameEngine) -> None:
         super().__init__(game_engine)
         self._buttons: list[tk.Button] = []
+        # Widget updates requested from other threads (e.g. the game loop) are queued here and
+        # applied by the Tk thread, so callers never block on, or race with, the Tk event loop.
+        self._ui_calls: SimpleQueue[Callable[[], object]] = SimpleQueue()
+        self._ui_thread: threading.Thread | None = None
 
     def run(self) -> None:
         self._root = tk.Tk()
         self._root.title(self.TITLE)
         self._root.protocol("WM_DELETE_WINDOW", self._stop)
         self._build_grid()
+        self._ui_thread = threading.current_thread()
         super().run()
+        self._root.after(self.UI_CALLS_POLL_MS, self._process_ui_calls)
         self._root.mainloop()
 
     def _stop(self) -> None:
@@ -32,11 +41,28 @@ class TkUi(Ui):
         super().enable_input()
         if not self._running:
             return
-        self._root.title(f"{self.TITLE} - Player {self._game_engine.game.current_player_symbol}")
+        title = f"{self.TITLE} - Player {self._game_engine.game.current_player_symbol}"
+        self._call_in_ui_thread(partial(self._root.title, title))
 
     def _disable_input(self) -> None:
         super()._disable_input()
-        self._root.title(self.TITLE)
+        self._call_in_ui_thread(partial(self._root.title, self.TITLE))
+
+    def _call_in_ui_thread(self, func: Callable[[], object]) -> None:
+        if threading.current_thread() is self._ui_thread:
+            func()
+        else:
+            self._ui_calls.put(func)
+
+    def _process_ui_calls(self) -> None:
+        while True:
+            try:
+                func = self._ui_calls.get_nowait()
+            except Empty:
+                break
+            func()
+        if self._running:
+            self._root.after(self.UI_CALLS_POLL_MS, self._process_ui_calls)
 
     def _build_grid(self) -> None:
         total_buttons = BOARD_SIZE * BOARD_SIZE
@@ -58,13 +84,15 @@ class TkUi(Ui):
         self._queue_move(row, col)
 
     def _render_board(self) -> None:
-        for i, btn in enumerate(self._buttons):
-            row, col = divmod(i, BOARD_SIZE)
-            value = self._game_engine.game.board.board[row][col]
+        self._call_in_ui_thread(self._update_buttons)
+
+    def _update_buttons(self) -> None:
+        cells = self._game_engine.game.board.cells
+        for btn, value in zip(self._buttons, cells, strict=True):
             btn.config(text=value if value is not None else "")
 
     def _show_end_message(self, msg: str) -> None:
-        threading.Thread(target=self._show_end_message_internal, daemon=True, args=(msg,)).start()
+        self._call_in_ui_thread(partial(self._show_end_message_internal, msg))
 
     def _show_end_message_internal(self, msg: str) -> None:
         messagebox.showinfo("Game Over", msg)
@@ -35,7 +35,7 @@ class FakeUI(Ui):
         super().on_error(_exception)
 
     @property
-    def board(self) -> list[list[PlayerSymbol | None]]:
+    def board(self) -> tuple[tuple[PlayerSymbol | None, ...], ...]:
         return self._game_engine.game.board.board
 
     def simulate_move(self, row: int, col: int) -> None: